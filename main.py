@@ -14,12 +14,12 @@ import time
 import datetime
 import logging
 from pathlib import Path
-from termcolor import colored
+from tqdm.auto import tqdm
 
 load_dotenv()
 
 # local package
-from wordgen.utils import print_banner, spinner, make_session_log, save_last_wordlist
+from wordgen.utils import print_banner, spinner_thread, make_session_log, save_last_wordlist, ChunkWriter, colored
 from wordgen.generator import generate_wordlist_stream, slug, normalize
 
 # .env faylini yuklash
@@ -29,6 +29,8 @@ SECRET_PHRASE = os.getenv("CONFIRMATION_PHRASE")
 
 # defaults
 DEFAULT_MAX_WORDS = 200000
+WRITE_CHUNK_BYTES = 1 << 18     # hand encoded candidates to the writer every 256 KiB
+WRITE_QUEUE_CHUNKS = 8          # max chunks waiting for the writer thread
 
 # Logging setup
 def setup_logger(logfile: Path):
@@ -96,13 +98,17 @@ def main():
     # Banner
     print_banner()
 
-    # spinner
+    # spinner (runs in the background while the session is prepared)
+    spin = None
     if not args.no_spinner:
-        for _ in spinner(duration=1.8, interval=0.06):
-            pass
+        spin = spinner_thread(duration=1.8, interval=0.06)
 
-    # Create session log path and logger
+    # Create session log path; the logger prints, so stop the spinner first
     logpath = make_session_log()
+    if spin is not None:
+        stop, t = spin
+        stop.set()
+        t.join(timeout=0.5)
     logger = setup_logger(logpath)
     if args.no_log:
         # disable file handlers
@@ -151,17 +157,46 @@ def main():
     start = time.time()
     written = 0
     try:
-        with out.open("w", encoding="utf-8") as fout:
-            # progress bar using tqdm
-            from tqdm import tqdm
-            with tqdm(total=args.max_words, unit="pw", ncols=90, desc="Generating") as pbar:
-                for pw in generate_wordlist_stream(inputs, max_words=args.max_words):
-                    fout.write(pw + "\n")
-                    written += 1
-                    pbar.update(1)
-                if written < args.max_words:
-                    pbar.total = written
-                    pbar.refresh()
+        # raw fd: we only stream whole chunks, no need for a buffered file object
+        fd = os.open(out, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o644)
+        try:
+            if hasattr(os, "posix_fadvise"):
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            # generation runs here, disk writes run on the writer thread
+            writer = ChunkWriter(fd, max_pending=WRITE_QUEUE_CHUNKS)
+            try:
+                # progress bar using tqdm (updated per handed-off chunk, hidden when piped)
+                with tqdm(total=args.max_words, unit="pw", ncols=90, desc="Generating",
+                          mininterval=0.5, maxinterval=2.0, smoothing=0.1,
+                          disable=not sys.stdout.isatty()) as pbar:
+                    # encode once at the sink and hand off whole chunks (no text layer)
+                    buf = bytearray()
+                    pending = 0
+                    try:
+                        for pw in generate_wordlist_stream(inputs, max_words=args.max_words):
+                            buf += pw.encode("utf-8")
+                            buf += b"\n"
+                            written += 1
+                            pending += 1
+                            if len(buf) >= WRITE_CHUNK_BYTES:
+                                writer.write(buf)
+                                buf = bytearray()
+                                pbar.update(pending)
+                                pending = 0
+                    finally:
+                        # flush the tail (also on Ctrl+C so partial output is kept)
+                        if buf:
+                            writer.write(buf)
+                            buf = bytearray()
+                        if pending:
+                            pbar.update(pending)
+                    if written < args.max_words:
+                        pbar.total = written
+                        pbar.refresh()
+            finally:
+                writer.close()
+        finally:
+            os.close(fd)
     except KeyboardInterrupt:
         logger.warning("Generation interrupted by user. Partial output saved.")
     except Exception as e:
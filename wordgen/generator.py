@@ -14,10 +14,11 @@ Professional OSINT Wordlist generation engine.
 from __future__ import annotations
 import re
 import itertools
+import math
 import datetime
 import string
-import secrets
-from typing import Dict, List, Generator, Iterable, Set, Any, Optional
+import random
+from typing import Dict, List, Generator, Iterable, Iterator, Sequence, Set, Tuple, Any, Optional
 
 # -----------------------------------------------------------
 # Configuration: tweak these for different behaviour/size
@@ -28,7 +29,14 @@ MAX_COMBINATIONS = 3            # up to 3-token permutations
 MAX_ADDITIONAL_INSERTS = 3      # max inserted numbers/symbols blocks per candidate
 SYMBOLS = list("!@#$%^&*()-_+=[]{};:,.<>?/\\|")  # pool of symbols to insert
 DIGITS = list("0123456789")
-COMMON_SUFFIXES = ["123","1234","12345","2020","2021","2022","2023","2024","007"]
+# immutable pools used on the hot path (SYMBOLS/DIGITS stay the public config)
+_SYMBOLS_TUPLE = tuple(SYMBOLS)
+_DIGITS_TUPLE = tuple(DIGITS)
+# separators for joined parts; None stands for "a random symbol"
+_SEPARATORS = ("", "", "", "-", "_", ".", "", None)
+_THIS_YEAR = datetime.date.today().year
+# number runs + the last few years (computed at import so it never goes stale)
+COMMON_SUFFIXES = ["123","1234","12345"] + [str(_THIS_YEAR - i) for i in range(5, -1, -1)] + ["007"]
 COMMON_PREFIXES = ["!", "#", "@", "*"]
 KEYBOARD_ADJ = ["qwerty","asdf","zxcv","123qwe","qaz"]
 # Probability weights for inserting patterns (0..1)
@@ -37,9 +45,16 @@ P_INSERT_DIGIT_BLOCK = 0.55
 P_LEET_CHANGE = 0.35
 P_MIX_CASE = 0.65
 P_JOIN_WITH_SYMBOL = 0.45
+# Same weights as integer thresholds for the 0..99 percent draws
+_P_MIX_T = int(P_MIX_CASE*100)
+_P_LEET_T = int(P_LEET_CHANGE*100)
+_P_SYM_T = int(P_INSERT_SYMBOL_BLOCK*100)
 # Limit how many outputs per base token to avoid explosion
 MAX_VARIANTS_PER_BASE = 50
 
+# Random draws are pulled from the selection RNG in batches of this size
+RANDOM_BATCH = 4096
+
 # LEET mapping (common)
 LEET_MAP = {
     "a": ["4","@"],
@@ -53,51 +68,76 @@ LEET_MAP = {
     "g": ["9"],
     "z": ["2"]
 }
+# Flat ASCII lookup built from LEET_MAP: _LEET_SUBS[ord(ch)] -> substitutions
+_LEET_SUBS = tuple(tuple(LEET_MAP.get(chr(c), ())) for c in range(128))
 
 # -----------------------------------------------------------
 # Helpers
 # -----------------------------------------------------------
 
+# Precompiled patterns + ASCII translate tables (str.translate is a C loop)
+_WS_RE = re.compile(r"\s+")
+_NON_DIGIT_RE = re.compile(r"\D")
+_ADDR_SPLIT_RE = re.compile(r"[,\\s/\\\\]+")
+_ASCII_DROP_WS = str.maketrans({c: None for c in map(chr, range(128)) if c.isspace()})
+_ASCII_KEEP_DIGITS = str.maketrans({c: None for c in map(chr, range(128)) if not c.isdigit()})
+
 def slug(s: str) -> str:
     if not s:
         return ""
-    return re.sub(r"\s+", "", s)
+    if s.isascii():
+        return s.translate(_ASCII_DROP_WS)
+    return _WS_RE.sub("", s)
+
+def only_digits(s: str) -> str:
+    """Strip everything but digits (e.g. phone numbers)."""
+    if s.isascii():
+        return s.translate(_ASCII_KEEP_DIGITS)
+    return _NON_DIGIT_RE.sub("", s)
 
 def normalize(tok: str) -> str:
     return tok.strip()
 
-def generate_years_from_age(age: str) -> List[str]:
-    out = []
+def generate_years_from_age(age: str) -> Tuple[str, ...]:
     try:
-        a = int(age)
-        this = datetime.datetime.now().year
-        birth = this - a
-        out += [str(birth), str(birth)[-2:], str(birth-1), str(birth+1)]
+        birth = _THIS_YEAR - int(age)
     except Exception:
-        pass
-    return out
+        return ()
+    return (str(birth), str(birth)[-2:], str(birth-1), str(birth+1))
 
 def unique_preserve_order(seq: Iterable[str]) -> List[str]:
-    seen = set()
-    out = []
-    for x in seq:
-        if x and x not in seen:
-            seen.add(x)
-            out.append(x)
-    return out
+    # dict keeps insertion order; drop empty entries afterwards
+    return [x for x in dict.fromkeys(seq) if x]
+
+# Selection RNG. Candidates are only *picked* at random (nothing here is a
+# secret), so a seedable PRNG is enough and avoids a CSPRNG draw per call.
+_rng = random.Random()
+
+def _percent_stream(rng: random.Random, batch: int = RANDOM_BATCH) -> Iterator[int]:
+    """Endless stream of uniform 0..99 draws, produced in batches."""
+    population = range(100)
+    while True:
+        yield from rng.choices(population, k=batch)
+
+_next_pct = _percent_stream(_rng).__next__
+
+def reseed(seed: Optional[int] = None) -> None:
+    """Reseed the selection RNG (and drop already batched draws)."""
+    global _next_pct
+    _rng.seed(seed)
+    _next_pct = _percent_stream(_rng).__next__
 
-# safe random choice using secrets for unpredictability
-def rnd_choice(seq: List[Any]) -> Any:
-    return secrets.choice(seq)
+def rnd_choice(seq: Sequence[Any]) -> Any:
+    return _rng.choice(seq)
 
-def rnd_choices(seq: List[Any], k: int) -> List[Any]:
-    return [secrets.choice(seq) for _ in range(k)]
+def rnd_choices(seq: Sequence[Any], k: int) -> List[Any]:
+    return _rng.choices(seq, k=k)
 
 # -----------------------------------------------------------
 # Variant generators
 # -----------------------------------------------------------
 
-def case_variants(token: str) -> Iterable[str]:
+def case_variants(token: str) -> Iterator[str]:
     """Return common case variations: lower, upper, capitalized, alt caps."""
     if not token:
         return
@@ -111,94 +151,104 @@ def case_variants(token: str) -> Iterable[str]:
         mid = token[0:2].upper() + token[2:].lower()
         yield mid
 
-def leet_variants(token: str, max_out: int = MAX_LEET_PER_TOKEN) -> Iterable[str]:
+def leet_variants(token: str, max_out: int = MAX_LEET_PER_TOKEN) -> Iterator[str]:
     """Produce leet substitutions limited to max_out variants."""
-    if not token:
+    if not token or max_out <= 0:
         return
     token_low = token.lower()
-    positions = [i for i,ch in enumerate(token_low) if ch in LEET_MAP]
-    yielded = set()
+    # (position, substitutions) for every leet-mappable character
+    slots = [(i, _LEET_SUBS[o]) for i,o in enumerate(map(ord, token_low))
+             if o < 128 and _LEET_SUBS[o]]
 
     # always include original
-    yielded.add(token)
+    yielded = {token}
     yield token
+    if len(yielded) >= max_out:
+        return
 
-    # single substitutions
-    for i in positions:
-        for sub in LEET_MAP[token_low[i]]:
-            arr = list(token)
-            arr[i] = sub
-            out = "".join(arr)
-            if out not in yielded:
-                yielded.add(out)
-                yield out
-            # capitalized variant
-            yield out.capitalize() if len(out) > 1 else out
+    # single substitutions (slice once per position, no per-variant list copy)
+    for i,subs in slots:
+        head, tail = token[:i], token[i+1:]
+        for sub in subs:
+            out = head + sub + tail
+            # plain + capitalized variant
+            for cand in (out, out.capitalize()):
+                if cand not in yielded:
+                    yielded.add(cand)
+                    yield cand
+                    if len(yielded) >= max_out:
+                        return
 
     # double substitutions (combinatorial limited)
-    if len(positions) >= 2:
-        combos = itertools.combinations(positions, 2)
-        for i1,i2 in combos:
-            for a in LEET_MAP[token_low[i1]]:
-                for b in LEET_MAP[token_low[i2]]:
-                    arr = list(token)
-                    arr[i1] = a; arr[i2] = b
-                    out = "".join(arr)
-                    if out not in yielded:
-                        yielded.add(out)
-                        yield out
-    # cap
-    count = 0
-    for v in list(yielded):
-        count += 1
-        if count >= max_out:
-            break
+    if len(slots) >= 2:
+        for (i1,subs1),(i2,subs2) in itertools.combinations(slots, 2):
+            # build both halves once per pair, then one concat per variant
+            head, mid, tail = token[:i1], token[i1+1:i2], token[i2+1:]
+            lefts = [head + a + mid for a in subs1]
+            rights = [b + tail for b in subs2]
+            for left, right in itertools.product(lefts, rights):
+                out = left + right
+                if out not in yielded:
+                    yielded.add(out)
+                    yield out
+                    if len(yielded) >= max_out:
+                        return
 
 def random_case_token(token: str) -> str:
     """Randomly mix capitalization in a human-like way."""
     if not token:
         return token
-    chars = []
-    for c in token:
-        if secrets.randbelow(100) < 35:
-            chars.append(c.upper())
-        else:
-            chars.append(c.lower())
-    return "".join(chars)
+    if token.isascii():
+        # ASCII: start from the lowercase bytes and patch in uppercase bytes,
+        # no per-character str objects or list appends
+        buf = bytearray(token.lower(), "ascii")
+        up = token.upper().encode("ascii")
+        for i in range(len(buf)):
+            if _next_pct() < 35:
+                buf[i] = up[i]
+        return buf.decode("ascii")
+    return "".join([c.upper() if _next_pct() < 35 else c.lower() for c in token])
 
-def insert_symbol_block(base: str, count: int=1) -> str:
-    """Insert `count` symbol block(s) at random positions (start/mid/end)."""
-    if not base:
-        base = ""
+def _insert_block(base: str, alphabet: Tuple[str, ...], lengths: Tuple[int, ...], count: int) -> str:
+    """Insert `count` random blocks drawn from `alphabet` at start/end/mid."""
     for _ in range(count):
-        block_len = secrets.choice([1,2,3])
-        block = "".join(rnd_choices(SYMBOLS, block_len))
-        pos = secrets.choice(['start','end','mid'])
-        if pos == 'start':
+        block = "".join(rnd_choices(alphabet, _rng.choice(lengths)))
+        pos = _rng.randrange(3)  # 0=start, 1=end, 2=mid
+        if pos == 0:
             base = block + base
-        elif pos == 'end':
+        elif pos == 1:
             base = base + block
         else:
-            mid = secrets.randbelow(max(1, len(base)))
-            base = base[:mid] + block + base[mid:]
+            mid = _rng.randrange(max(1, len(base)))
+            base = f"{base[:mid]}{block}{base[mid:]}"
     return base
 
+def insert_symbol_block(base: str, count: int=1) -> str:
+    """Insert `count` symbol block(s) at random positions (start/mid/end)."""
+    return _insert_block(base or "", _SYMBOLS_TUPLE, (1,2,3), count)
+
 def insert_digit_block(base: str, count: int=1) -> str:
     """Insert digit block(s) similarly."""
-    if not base:
-        base = ""
-    for _ in range(count):
-        block_len = secrets.choice([1,2,3,4])
-        block = "".join(rnd_choices(DIGITS, block_len))
-        pos = secrets.choice(['start','end','mid'])
-        if pos == 'start':
-            base = block + base
-        elif pos == 'end':
-            base = base + block
-        else:
-            mid = secrets.randbelow(max(1, len(base)))
-            base = base[:mid] + block + base[mid:]
-    return base
+    return _insert_block(base or "", _DIGITS_TUPLE, (1,2,3,4), count)
+
+def sample_permutations(parts: List[str], r: int, limit: int) -> Iterator[Tuple[str, ...]]:
+    """
+    Yield up to `limit` distinct r-permutations of parts.
+    Enumerates them all when the limit covers P(n, r), otherwise draws
+    random index tuples so no work is spent on combos that never get used.
+    """
+    n = len(parts)
+    if limit >= math.perm(n, r):
+        yield from itertools.permutations(parts, r)
+        return
+    indices = range(n)
+    seen: Set[Tuple[int, ...]] = set()
+    while len(seen) < limit:
+        idx = tuple(_rng.sample(indices, r))
+        if idx in seen:
+            continue
+        seen.add(idx)
+        yield tuple(parts[i] for i in idx)
 
 def join_with_random_separator(parts: List[str]) -> str:
     """Join small list of parts with either nothing or a random separator symbol."""
@@ -206,8 +256,9 @@ def join_with_random_separator(parts: List[str]) -> str:
         return ""
     if len(parts) == 1:
         return parts[0]
-    sep_choices = ["", "", "", "-", "_", ".", "", rnd_choice(SYMBOLS)]
-    sep = rnd_choice(sep_choices)
+    sep = _rng.choice(_SEPARATORS)
+    if sep is None:
+        sep = _rng.choice(_SYMBOLS_TUPLE)
     return sep.join(parts)
 
 # -----------------------------------------------------------
@@ -217,60 +268,58 @@ def join_with_random_separator(parts: List[str]) -> str:
 def build_base_parts(inputs: Dict[str, Any]) -> List[str]:
     """Extract tokens from inputs and normalize them into a parts list."""
     parts: List[str] = []
+    append = parts.append
+    get = inputs.get
     for k in ("first","last","middle","nickname"):
-        v = inputs.get(k)
+        v = get(k)
         if v:
             v = normalize(str(v))
             if v:
-                parts.append(slug(v))
-                parts.append(v)
+                append(slug(v))
+                append(v)
     # phone -> digits, last4, first3
-    p = inputs.get("phone")
+    p = get("phone")
     if p:
-        digits = re.sub(r"\D", "", str(p))
+        digits = only_digits(str(p))
         if digits:
-            parts.append(digits)
+            append(digits)
             if len(digits) >= 4:
-                parts.append(digits[-4:])
-            parts.append(digits[:3])
+                append(digits[-4:])
+            append(digits[:3])
     # address tokens
-    addr = inputs.get("address")
+    addr = get("address")
     if addr:
-        for t in re.split(r"[,\\s/\\\\]+", str(addr)):
-            if t:
-                parts.append(slug(t))
+        parts.extend(slug(t) for t in _ADDR_SPLIT_RE.split(str(addr)) if t)
     # friends
-    for f in (inputs.get("friends") or []):
+    for f in (get("friends") or []):
         if f:
-            parts.append(slug(f))
-            parts.append(normalize(str(f)))
+            append(slug(f))
+            append(normalize(str(f)))
     # company/pet/hobby
     for k in ("company","pet","hobby"):
-        v = inputs.get(k)
+        v = get(k)
         if v:
-            parts.append(slug(v))
+            append(slug(v))
     # domain/email
-    email = inputs.get("email")
+    email = get("email")
     if email:
         local = str(email).split("@")[0]
-        parts.append(local)
-    domain = inputs.get("domain")
+        append(local)
+    domain = get("domain")
     if domain:
-        parts.append(domain)
+        append(domain)
         if str(domain).startswith("www."):
-            parts.append(str(domain)[4:])
-    # years
-    years = set()
-    age = inputs.get("age")
+            append(str(domain)[4:])
+    # years (dict keeps a stable order, unlike a set of str under hash randomization)
+    years: Dict[str, None] = {}
+    age = get("age")
     if age:
-        for y in generate_years_from_age(str(age)):
-            years.add(y)
+        years.update(dict.fromkeys(generate_years_from_age(str(age))))
     for k in ("birth_year","year"):
-        v = inputs.get(k)
+        v = get(k)
         if v:
-            years.add(str(v))
-    for y in years:
-        parts.append(y)
+            years[str(v)] = None
+    parts.extend(years)
     # dedupe preserve-order
     return unique_preserve_order(parts)
 
@@ -285,12 +334,20 @@ def generate_wordlist_stream(inputs: Dict[str, Any], max_words: int = DEFAULT_MA
     """
     # Optional seed for reproducibility (not cryptographically secure)
     if seed is not None:
-        import random
-        random.seed(seed)
+        reseed(seed)
     parts = build_base_parts(inputs)
     if not parts:
         return
 
+    # bind hot helpers/constants to locals (fast local lookups in the loops)
+    next_pct = _next_pct
+    leet = leet_variants
+    insert_symbols = insert_symbol_block
+    insert_digits = insert_digit_block
+    suffixes2 = COMMON_SUFFIXES[:3]
+    prefixes2 = COMMON_PREFIXES[:2]
+    keyboard2 = KEYBOARD_ADJ[:2]
+
     written = 0
 
     # Stage 1: single-token rich variants
@@ -304,15 +361,15 @@ def generate_wordlist_stream(inputs: Dict[str, Any], max_words: int = DEFAULT_MA
             if written >= max_words:
                 return
         # random mixed-case variant
-        if secrets.randbelow(100) < int(P_MIX_CASE*100):
+        if next_pct() < _P_MIX_T:
             mv = random_case_token(token)
             yield mv
             written += 1
             if written >= max_words:
                 return
         # leet variants (some)
-        if secrets.randbelow(100) < int(P_LEET_CHANGE*100):
-            for lv in leet_variants(token, max_out=MAX_LEET_PER_TOKEN):
+        if next_pct() < _P_LEET_T:
+            for lv in leet(token, max_out=MAX_LEET_PER_TOKEN):
                 yield lv
                 written += 1
                 if written >= max_words:
@@ -333,53 +390,57 @@ def generate_wordlist_stream(inputs: Dict[str, Any], max_words: int = DEFAULT_MA
 
     # Stage 2: permutations of tokens (1..MAX_COMBINATIONS) with mangling
     # We'll prioritize smaller permutations first (2-token combos) and produce realistic mixes.
+    # Every combo yields at least this many candidates (case + suffix + prefix + keyboard)
+    per_combo = 3 + len(suffixes2) + len(prefixes2) + len(keyboard2)
     for r in range(2, min(MAX_COMBINATIONS, len(parts)) + 1):
-        # iterate permutations but limit total produced by early break if max reached
-        for combo in itertools.permutations(parts, r):
+        # only walk as many combos as the remaining budget can use
+        budget = -(-(max_words - written) // per_combo)
+        for combo in sample_permutations(parts, r, budget):
             if written >= max_words:
                 return
             # join with random separator sometimes
             joined = join_with_random_separator(list(combo))
-            # produce case variants
-            for v in case_variants(joined):
+            # produce case variants (lower/upper/capitalized only; the mixed
+            # patterns of case_variants add little for multi-token joins)
+            for v in (joined.lower(), joined.upper(), joined.capitalize()):
                 yield v
                 written += 1
                 if written >= max_words:
                     return
             # maybe produce leet
-            if secrets.randbelow(100) < int(P_LEET_CHANGE*100):
-                for lv in leet_variants(joined, max_out=8):
+            if next_pct() < _P_LEET_T:
+                for lv in leet(joined, max_out=8):
                     yield lv
                     written += 1
                     if written >= max_words:
                         return
             # randomly insert symbols/digits blocks
-            inserts = secrets.randbelow(MAX_ADDITIONAL_INSERTS + 1)  # 0..MAX_ADDITIONAL_INSERTS
+            inserts = _rng.randrange(MAX_ADDITIONAL_INSERTS + 1)  # 0..MAX_ADDITIONAL_INSERTS
             if inserts:
                 # alternate insertion types
                 cur = joined
                 for _ in range(inserts):
-                    if secrets.randbelow(100) < int(P_INSERT_SYMBOL_BLOCK*100):
-                        cur = insert_symbol_block(cur, count=1)
+                    if next_pct() < _P_SYM_T:
+                        cur = insert_symbols(cur, count=1)
                     else:
-                        cur = insert_digit_block(cur, count=1)
+                        cur = insert_digits(cur, count=1)
                     yield cur
                     written += 1
                     if written >= max_words:
                         return
             # suffixes & prefixes
-            for suf in COMMON_SUFFIXES[:3]:
+            for suf in suffixes2:
                 yield joined + suf
                 written += 1
                 if written >= max_words:
                     return
-            for pre in COMMON_PREFIXES[:2]:
+            for pre in prefixes2:
                 yield pre + joined
                 written += 1
                 if written >= max_words:
                     return
             # keyboard adjacency appends
-            for kbd in KEYBOARD_ADJ[:2]:
+            for kbd in keyboard2:
                 yield joined + kbd
                 written += 1
                 if written >= max_words:
@@ -396,15 +457,15 @@ def generate_wordlist_stream(inputs: Dict[str, Any], max_words: int = DEFAULT_MA
                 continue
             combo = slug(main) + slug(f)
             # common combinations user might choose
-            variants = [combo, combo + "123", combo + "!" , combo + secrets.choice(DIGITS)]
+            variants = [combo, combo + "123", combo + "!" , combo + rnd_choice(_DIGITS_TUPLE)]
             for v in variants:
                 yield v
                 written += 1
                 if written >= max_words:
                     return
             # leet & symbol variants
-            if secrets.randbelow(100) < 50:
-                for lv in leet_variants(combo, max_out=6):
+            if next_pct() < 50:
+                for lv in leet(combo, max_out=6):
                     yield lv
                     written += 1
                     if written >= max_words:
@@ -424,7 +485,7 @@ def generate_wordlist_stream(inputs: Dict[str, Any], max_words: int = DEFAULT_MA
         if written >= max_words:
             return
         # insert small numbers
-        yield p + secrets.choice(DIGITS)
+        yield p + rnd_choice(_DIGITS_TUPLE)
         written += 1
         if written >= max_words:
             return
@@ -1,19 +1,46 @@
 #!/usr/bin/env python3
 # Utilities: logo, spinner, logging helper, minor helpers
 
+import os
 import sys
+import queue
 import time
+import threading
 import datetime
 from pathlib import Path
-from termcolor import colored
-from pyfiglet import Figlet
 
 LOG_ROOT = Path.home() / ".osint_wordgen" / "logs"
 LOG_ROOT.mkdir(parents=True, exist_ok=True)
 
+# "HAMROQULOV" pre-rendered with pyfiglet's "big" font, so pyfiglet is not
+# needed at runtime for the default banner
+_BANNER = r"""
+ _    _          __  __ _____   ____   ____  _    _ _      ______      __
+| |  | |   /\   |  \/  |  __ \ / __ \ / __ \| |  | | |    / __ \ \    / /
+| |__| |  /  \  | \  / | |__) | |  | | |  | | |  | | |   | |  | \ \  / /
+|  __  | / /\ \ | |\/| |  _  /| |  | | |  | | |  | | |   | |  | |\ \/ /
+| |  | |/ ____ \| |  | | | \ \| |__| | |__| | |__| | |___| |__| | \  /
+|_|  |_/_/    \_\_|  |_|_|  \_\\____/ \___\_\\____/|______\____/   \/
+"""[1:] + "\n\n"
+
+def colored(text, *args, **kwargs):
+    """termcolor.colored, imported on first use; plain text when NO_COLOR is set."""
+    if os.environ.get("NO_COLOR"):
+        return text
+    from termcolor import colored as _colored
+    return _colored(text, *args, **kwargs)
+
+def render_big_text(text):
+    if text == "HAMROQULOV":
+        return _BANNER
+    try:
+        from pyfiglet import Figlet
+    except ImportError:
+        return text + "\n"
+    return Figlet(font="big").renderText(text)
+
 def print_banner(big_text="HAMROQULOV", subtitle="OSINT WordGen v1.0"):
-    f = Figlet(font="big")
-    big = f.renderText(big_text)
+    big = render_big_text(big_text)
     print(colored(big, "cyan"))
     # Right-side-ish subtitle
     width = 80
@@ -21,18 +48,31 @@ def print_banner(big_text="HAMROQULOV", subtitle="OSINT WordGen v1.0"):
     print(colored(" " * pad + subtitle + "\n", "yellow"))
     print(colored("🔎 Smart OSINT-based password wordlist generator — Authorized use only\n", "green"))
 
-def spinner(duration=2.0, interval=0.08):
-    symbols = ["|", "/", "-", "\"]"]
-    start = time.time()
-    i = 0
-    while (time.time() - start) < duration:
-        sys.stdout.write("\r  Starting " + symbols[i % len(symbols)])
+def spinner_thread(duration=2.0, interval=0.08):
+    """Start the startup spinner in a daemon thread.
+
+    Returns (stop, thread): the spinner ends after `duration` seconds or as
+    soon as `stop` is set, so callers can do real work while it spins.
+    """
+    stop = threading.Event()
+
+    def run():
+        symbols = ["|", "/", "-", "\\"]
+        start = time.time()
+        i = 0
+        while (time.time() - start) < duration:
+            # \r frames carry no newline, so flush to actually show them
+            sys.stdout.write("\r  Starting " + symbols[i % len(symbols)])
+            sys.stdout.flush()
+            if stop.wait(interval):
+                break
+            i += 1
+        sys.stdout.write("\r  Starting done!        \n")
         sys.stdout.flush()
-        time.sleep(interval)
-        i += 1
-        yield None
-    sys.stdout.write("\r  Starting done!        \n")
-    sys.stdout.flush()
+
+    t = threading.Thread(target=run, name="spinner", daemon=True)
+    t.start()
+    return stop, t
 
 def now_ts():
     return datetime.datetime.now().strftime("%Y%m%d-%H%M%S")
@@ -46,6 +86,51 @@ def save_last_wordlist(path: str):
     except Exception:
         pass
 
+def write_all(fd, data):
+    """os.write() until all of `data` is written (handles short writes)."""
+    view = memoryview(data)
+    while view:
+        n = os.write(fd, view)
+        view = view[n:]
+
+class ChunkWriter:
+    """Write byte chunks to a file descriptor from a background thread.
+
+    write() hands a chunk over through a bounded queue (blocks when
+    `max_pending` chunks are waiting), close() drains the queue and joins.
+    A write error is re-raised on the next write()/close().
+    """
+
+    def __init__(self, fd, max_pending=8):
+        self.fd = fd
+        self.error = None
+        self._queue = queue.Queue(maxsize=max_pending)
+        self._thread = threading.Thread(target=self._run, name="wordlist-writer", daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while True:
+            chunk = self._queue.get()
+            if chunk is None:
+                return
+            if self.error is None:
+                try:
+                    write_all(self.fd, chunk)
+                except Exception as e:
+                    # keep draining so the producer never blocks on a dead writer
+                    self.error = e
+
+    def write(self, chunk):
+        if self.error is not None:
+            raise self.error
+        self._queue.put(chunk)
+
+    def close(self):
+        self._queue.put(None)
+        self._thread.join()
+        if self.error is not None:
+            raise self.error
+
 def make_session_log():
     ts = now_ts()
     path = LOG_ROOT / f"session-{ts}.log"